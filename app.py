@@ -9,10 +9,13 @@ import firebase_admin
 from firebase_admin import credentials, auth, db
 import mysql.connector
 from mysql.connector import errorcode
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
 import json
+from queries import run_query, run_query_one
+import threading
+import numpy as np
 
 load_dotenv()
 
@@ -43,6 +46,13 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'homelike')
 }
 
+# Longest a write may take to commit after taking its updated_at. Delta-sync
+# watermarks trail the clock by this much; analytics re-reads this far back.
+DELTA_SYNC_OVERLAP = timedelta(seconds=5)
+
+# Floor stored for amenities with no floor recorded (0 is a real ground floor)
+UNKNOWN_FLOOR = -1
+
 def get_db_connection():
     """Establish MySQL database connection."""
     try:
@@ -64,16 +74,14 @@ def get_user_role(user_email):
     
     try:
         # Check if user is a Warden
-        cursor.execute("SELECT * FROM Warden WHERE Wmail = %s", (user_email,))
-        warden = cursor.fetchone()
+        warden = run_query_one(cursor, 'warden_by_email', (user_email,))
         if warden:
             cursor.close()
             conn.close()
             return 'warden', warden
         
         # Check if user is a Student
-        cursor.execute("SELECT * FROM Student WHERE Smail = %s", (user_email,))
-        student = cursor.fetchone()
+        student = run_query_one(cursor, 'student_by_email', (user_email,))
         if student:
             cursor.close()
             conn.close()
@@ -85,6 +93,50 @@ def get_user_role(user_email):
     
     return None, None
 
+def get_complaint_amenity(complaint):
+    """Return (complaint_type, amenity_id) for a Complaint row."""
+    if complaint['RNo']:
+        return 'Room', complaint['RNo']
+    if complaint['WashroomID']:
+        return 'Washroom', complaint['WashroomID']
+    return 'Filter', complaint['FId']
+
+def serialize_complaint(complaint):
+    """Convert a Complaint row for JSON: ISO timestamps plus complaint_type/amenity_id."""
+    complaint['date_time'] = complaint['date_time'].isoformat()
+    if complaint.get('updated_at'):
+        complaint['updated_at'] = complaint['updated_at'].isoformat()
+    complaint['complaint_type'], complaint['amenity_id'] = get_complaint_amenity(complaint)
+    return complaint
+
+def update_complaint_rollup(cursor, hostel_id, filed_at, complaint_type, amenity_id, status_deltas):
+    """
+    Apply {status: delta} to the ComplaintRollup counts of one complaint's
+    (HId, day, Block, Floor, amenity type) bucket.
+    Runs on the caller's cursor so it commits with the complaint write.
+    """
+    location_queries = {
+        'Room': 'room_location',
+        'Washroom': 'washroom_location',
+        'Filter': 'filter_location'
+    }
+    location = run_query_one(cursor, location_queries[complaint_type], (amenity_id,)) or {}
+    
+    for status, delta in status_deltas.items():
+        run_query(
+            cursor,
+            'upsert_complaint_rollup',
+            (
+                hostel_id,
+                filed_at.date(),
+                location.get('Block') or '',
+                UNKNOWN_FLOOR if location.get('Floor') is None else location['Floor'],
+                complaint_type,
+                status,
+                delta
+            )
+        )
+
 # ==================== AUTHENTICATION ROUTES ====================
 
 @app.route('/')
@@ -210,11 +262,7 @@ def file_complaint():
         
         try:
             # Get student's warden
-            cursor.execute(
-                "SELECT w.WardenID FROM Warden w WHERE w.HId = %s LIMIT 1",
-                (hostel_id,)
-            )
-            warden_result = cursor.fetchone()
+            warden_result = run_query_one(cursor, 'hostel_warden', (hostel_id,))
             
             if not warden_result:
                 conn.close()
@@ -223,8 +271,7 @@ def file_complaint():
             warden_id = warden_result['WardenID']
             
             # Generate complaint ID
-            cursor.execute("SELECT COUNT(*) as cnt FROM Complaint")
-            count = cursor.fetchone()['cnt']
+            count = run_query_one(cursor, 'complaint_count')['cnt']
             complaint_id = f"C{hostel_id}{count + 1}"
             
             # Prepare complaint data
@@ -242,16 +289,12 @@ def file_complaint():
                 return jsonify({'error': 'Invalid complaint type'}), 400
             
             # Insert complaint
-            insert_query = """
-            INSERT INTO Complaint 
-            (CId, description, Status, date_time, SId, WardenID, HId, RNo, WashroomID, FId)
-            VALUES (%s, %s, 'Pending', %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_query, (
+            filed_at = datetime.now()
+            run_query(cursor, 'insert_complaint', (
                 complaint_id,
                 description,
-                datetime.now(),
+                filed_at,
+                filed_at,
                 student_id,
                 warden_id,
                 hostel_id,
@@ -259,6 +302,9 @@ def file_complaint():
                 washroom_id,
                 filter_id
             ))
+            update_complaint_rollup(
+                cursor, hostel_id, filed_at, complaint_type, amenity_id, {'Pending': 1}
+            )
             
             conn.commit()
             
@@ -294,29 +340,11 @@ def get_student_complaints():
         cursor = conn.cursor(dictionary=True)
         
         try:
-            query = """
-            SELECT 
-                CId, description, Status, date_time,
-                RNo, WashroomID, FId
-            FROM Complaint
-            WHERE SId = %s
-            ORDER BY date_time DESC
-            """
-            
-            cursor.execute(query, (student_id,))
-            complaints = cursor.fetchall()
+            complaints = run_query(cursor, 'student_complaints', (student_id,))
             
             # Convert datetime objects to strings
             for complaint in complaints:
-                complaint['date_time'] = complaint['date_time'].isoformat()
-                complaint['complaint_type'] = (
-                    'Room' if complaint['RNo'] else
-                    'Washroom' if complaint['WashroomID'] else
-                    'Filter'
-                )
-                complaint['amenity_id'] = (
-                    complaint['RNo'] or complaint['WashroomID'] or complaint['FId']
-                )
+                serialize_complaint(complaint)
             
             return jsonify({
                 'success': True,
@@ -331,6 +359,63 @@ def get_student_complaints():
         print(f"Error retrieving complaints: {str(e)}")
         return jsonify({'error': 'Failed to retrieve complaints'}), 500
 
+@app.route('/api/student/complaints/delta', methods=['GET'])
+def get_student_complaints_delta():
+    """
+    Complaints of the logged-in student created or changed after the `since`
+    watermark (ISO timestamp from a previous response). Without `since`,
+    returns the full history. Clients merge the result by CId and keep the
+    returned watermark for the next call; with no new writes the delta is empty.
+    """
+    if 'user' not in session or session['user']['role'] != 'student':
+        return jsonify({'error': 'Unauthorized'}), 401
+    
+    try:
+        student_id = session['user']['id']
+        
+        since_param = request.args.get('since')
+        try:
+            since = datetime.fromisoformat(since_param) if since_param else None
+        except ValueError:
+            return jsonify({'error': 'Invalid since value'}), 400
+        if since and since.tzinfo:
+            # updated_at is stored as naive server-local time
+            since = since.astimezone().replace(tzinfo=None)
+        
+        conn = get_db_connection()
+        if not conn:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        cursor = conn.cursor(dictionary=True)
+        
+        try:
+            # Taken before reading: writes still committing have updated_at
+            # after this watermark and are picked up by the next call
+            watermark = datetime.now() - DELTA_SYNC_OVERLAP
+            if since and since > watermark:
+                watermark = since
+            
+            complaints = run_query(
+                cursor, 'student_complaints_delta', (student_id, since or datetime(1970, 1, 1))
+            )
+            
+            for complaint in complaints:
+                serialize_complaint(complaint)
+            
+            return jsonify({
+                'success': True,
+                'complaints': complaints,
+                'watermark': watermark.isoformat()
+            }), 200
+            
+        finally:
+            cursor.close()
+            conn.close()
+            
+    except Exception as e:
+        print(f"Error retrieving complaint delta: {str(e)}")
+        return jsonify({'error': 'Failed to retrieve complaints'}), 500
+
 @app.route('/api/student/confirm-resolution/<complaint_id>', methods=['POST'])
 def confirm_resolution(complaint_id):
     """
@@ -350,20 +435,24 @@ def confirm_resolution(complaint_id):
         
         try:
             # Verify complaint belongs to student and is in Resolved status
-            cursor.execute(
-                "SELECT * FROM Complaint WHERE CId = %s AND SId = %s AND Status = 'Resolved'",
-                (complaint_id, student_id)
+            complaint = run_query_one(
+                cursor, 'student_resolved_complaint', (complaint_id, student_id)
             )
-            complaint = cursor.fetchone()
             
             if not complaint:
                 conn.close()
                 return jsonify({'error': 'Complaint not found or not in Resolved status'}), 404
             
-            # Update status to Confirmed
-            cursor.execute(
-                "UPDATE Complaint SET Status = 'Confirmed' WHERE CId = %s",
-                (complaint_id,)
+            # Update status to Confirmed; a concurrent confirm (double click) matches no row
+            now = datetime.now()
+            run_query(cursor, 'confirm_complaint', (now, now, complaint_id))
+            if cursor.rowcount != 1:
+                conn.rollback()
+                return jsonify({'error': 'Complaint not found or not in Resolved status'}), 404
+            complaint_type, amenity_id = get_complaint_amenity(complaint)
+            update_complaint_rollup(
+                cursor, complaint['HId'], complaint['date_time'],
+                complaint_type, amenity_id, {'Resolved': -1, 'Confirmed': 1}
             )
             conn.commit()
             
@@ -402,20 +491,7 @@ def get_warden_complaints():
         cursor = conn.cursor(dictionary=True)
         
         try:
-            query = """
-            SELECT 
-                c.CId, c.description, c.Status, c.date_time,
-                c.SId, s.SName, s.Smail,
-                c.RNo, c.WashroomID, c.FId,
-                c.HId
-            FROM Complaint c
-            JOIN Student s ON c.SId = s.SId
-            WHERE c.WardenID = %s AND c.HId = %s
-            ORDER BY c.date_time DESC
-            """
-            
-            cursor.execute(query, (warden_id, hostel_id))
-            complaints = cursor.fetchall()
+            complaints = run_query(cursor, 'warden_complaints', (warden_id, hostel_id))
             
             # Convert datetime objects to strings
             for complaint in complaints:
@@ -462,22 +538,28 @@ def resolve_complaint(complaint_id):
         
         try:
             # Verify complaint exists and belongs to warden
-            cursor.execute(
-                "SELECT * FROM Complaint WHERE CId = %s AND WardenID = %s AND HId = %s",
-                (complaint_id, warden_id, hostel_id)
+            complaint = run_query_one(
+                cursor, 'warden_complaint', (complaint_id, warden_id, hostel_id)
             )
-            complaint = cursor.fetchone()
             
             if not complaint:
                 conn.close()
                 return jsonify({'error': 'Complaint not found'}), 404
             
-            # Update status to Resolved
-            cursor.execute(
-                "UPDATE Complaint SET Status = 'Resolved' WHERE CId = %s",
-                (complaint_id,)
-            )
-            conn.commit()
+            # Update status to Resolved, only from the status read above so the
+            # rollup deltas match the transition actually applied
+            if complaint['Status'] != 'Resolved':
+                now = datetime.now()
+                run_query(cursor, 'resolve_complaint', (now, now, complaint_id, complaint['Status']))
+                if cursor.rowcount != 1:
+                    conn.rollback()
+                    return jsonify({'error': 'Complaint was updated by another request, please retry'}), 409
+                complaint_type, amenity_id = get_complaint_amenity(complaint)
+                update_complaint_rollup(
+                    cursor, complaint['HId'], complaint['date_time'],
+                    complaint_type, amenity_id, {complaint['Status']: -1, 'Resolved': 1}
+                )
+                conn.commit()
             
             return jsonify({
                 'success': True,
@@ -512,32 +594,24 @@ def get_warden_stats():
         
         try:
             # Total complaints
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM Complaint WHERE WardenID = %s AND HId = %s",
-                (warden_id, hostel_id)
-            )
-            total = cursor.fetchone()['count']
+            total = run_query_one(
+                cursor, 'warden_complaint_count', (warden_id, hostel_id)
+            )['count']
             
             # Pending complaints
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM Complaint WHERE WardenID = %s AND HId = %s AND Status = 'Pending'",
-                (warden_id, hostel_id)
-            )
-            pending = cursor.fetchone()['count']
+            pending = run_query_one(
+                cursor, 'warden_complaint_count_by_status', (warden_id, hostel_id, 'Pending')
+            )['count']
             
             # Resolved complaints
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM Complaint WHERE WardenID = %s AND HId = %s AND Status = 'Resolved'",
-                (warden_id, hostel_id)
-            )
-            resolved = cursor.fetchone()['count']
+            resolved = run_query_one(
+                cursor, 'warden_complaint_count_by_status', (warden_id, hostel_id, 'Resolved')
+            )['count']
             
             # Confirmed complaints
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM Complaint WHERE WardenID = %s AND HId = %s AND Status = 'Confirmed'",
-                (warden_id, hostel_id)
-            )
-            confirmed = cursor.fetchone()['count']
+            confirmed = run_query_one(
+                cursor, 'warden_complaint_count_by_status', (warden_id, hostel_id, 'Confirmed')
+            )['count']
             
             return jsonify({
                 'success': True,
@@ -557,5 +631,351 @@ def get_warden_stats():
         print(f"Error retrieving stats: {str(e)}")
         return jsonify({'error': 'Failed to retrieve statistics'}), 500
 
+# ==================== ANALYTICS ====================
+
+# Dimensions resolution analytics can be grouped by (keys of the snapshot)
+ANALYTICS_DIMENSIONS = ('hostel', 'amenity', 'block', 'floor')
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+# Inner histogram edges in hours; the outer buckets are open-ended
+LATENCY_BUCKET_EDGES = np.array([1, 6, 24, 72, 168, 720], dtype=float)
+LATENCY_BUCKET_LABELS = ('<1h', '1-6h', '6-24h', '1-3d', '3-7d', '7-30d', '>30d')
+# Most computed results kept between writes; oldest are evicted first
+ANALYTICS_CACHE_SIZE = 64
+
+# Wardens allowed to view analytics of other hostels (comma separated WardenIDs)
+CROSS_HOSTEL_WARDENS = {
+    warden_id.strip() for warden_id in os.getenv('CROSS_HOSTEL_WARDENS', '').split(',') if warden_id.strip()
+}
+
+# Snapshot columns (arrays) and computed results. The snapshot is refreshed
+# incrementally from rows whose updated_at passed the cached watermark.
+SNAPSHOT_COLUMNS = ('hostel', 'amenity', 'block', 'floor', 'created', 'resolved', 'confirmed')
+_analytics_cache = {'watermark': None, 'snapshot': None, 'positions': {}, 'results': {}}
+_analytics_lock = threading.Lock()
+
+def epoch_seconds(values):
+    """
+    Convert naive DB datetimes (None allowed) to float seconds, NaN when unset.
+    Both sides of every comparison are naive, so no timezone is ever applied.
+    """
+    stamps = np.array(values, dtype='datetime64[us]')
+    seconds = stamps.astype(np.int64) / 1e6
+    seconds[np.isnat(stamps)] = np.nan
+    return seconds
+
+def load_complaint_changes(cursor, since):
+    """
+    Load complaints changed after `since` as column arrays, joined with
+    Rooms/Washroom/Filter for block and floor. Expects a non-dictionary cursor.
+    """
+    rows = run_query(cursor, 'complaint_snapshot', (since,))
+    cid, hostel, amenity, block, floor, created, resolved, confirmed = (
+        zip(*rows) if rows else [()] * 8
+    )
+    
+    return list(cid), {
+        'hostel': np.array(hostel, dtype=str),
+        'amenity': np.array(amenity, dtype=str),
+        'block': np.array(block, dtype=str),
+        'floor': np.array(floor, dtype=np.int64),
+        'created': epoch_seconds(created),
+        'resolved': epoch_seconds(resolved),
+        'confirmed': epoch_seconds(confirmed)
+    }
+
+def merge_complaint_changes(cids, changes):
+    """Overwrite changed complaints in the cached snapshot and append new ones."""
+    snapshot = _analytics_cache['snapshot']
+    positions = _analytics_cache['positions']
+    
+    if snapshot is None:
+        _analytics_cache['snapshot'] = changes
+        _analytics_cache['positions'] = {cid: i for i, cid in enumerate(cids)}
+        return
+    
+    updated = [(i, positions[cid]) for i, cid in enumerate(cids) if cid in positions]
+    added = [i for i, cid in enumerate(cids) if cid not in positions]
+    
+    for column in SNAPSHOT_COLUMNS:
+        # Widen fixed-size string columns so longer labels are not truncated
+        values = snapshot[column].astype(np.result_type(snapshot[column], changes[column]))
+        if updated:
+            source, target = map(list, zip(*updated))
+            values[target] = changes[column][source]
+        snapshot[column] = np.concatenate([values, changes[column][added]])
+    
+    size = len(positions)
+    for offset, i in enumerate(added):
+        positions[cids[i]] = size + offset
+
+def summarize_latency(hours):
+    """Mean, percentiles and bucketed histogram for an array of latencies in hours."""
+    hours = hours[~np.isnan(hours)]
+    histogram = np.bincount(
+        np.searchsorted(LATENCY_BUCKET_EDGES, hours, side='right'),
+        minlength=len(LATENCY_BUCKET_LABELS)
+    )
+    
+    if hours.size == 0:
+        mean = None
+        percentiles = {f'p{p}': None for p in LATENCY_PERCENTILES}
+    else:
+        mean = round(float(hours.mean()), 2)
+        percentiles = {
+            f'p{p}': round(float(value), 2)
+            for p, value in zip(LATENCY_PERCENTILES, np.percentile(hours, LATENCY_PERCENTILES))
+        }
+    
+    return {
+        'count': int(hours.size),
+        'mean_hours': mean,
+        'percentiles_hours': percentiles,
+        'histogram': dict(zip(LATENCY_BUCKET_LABELS, histogram.tolist()))
+    }
+
+def group_label(dim, value):
+    """JSON label of a group: floors as int, other dimensions as str; None when unknown."""
+    if dim == 'floor':
+        return None if value == UNKNOWN_FLOOR else int(value)
+    return str(value) or None
+
+def compute_resolution_analytics(snapshot, group_by, since, hostel_id=None):
+    """
+    Group complaints filed at or after `since` (naive datetime) by the given
+    dimensions and summarize time-to-resolve (filed -> resolved) and
+    time-to-confirm (resolved -> confirmed) for every group.
+    """
+    mask = snapshot['created'] >= epoch_seconds([since])[0]
+    if hostel_id:
+        mask &= snapshot['hostel'] == hostel_id
+    
+    resolved = snapshot['resolved'][mask]
+    to_resolve = (resolved - snapshot['created'][mask]) / 3600.0
+    to_confirm = (snapshot['confirmed'][mask] - resolved) / 3600.0
+    
+    # Combine the per-dimension codes into one group code per complaint
+    dimensions = {dim: snapshot[dim][mask] for dim in group_by}
+    codes = np.zeros(to_resolve.size, dtype=np.int64)
+    for dim in group_by:
+        uniques, inverse = np.unique(dimensions[dim], return_inverse=True)
+        codes = codes * len(uniques) + inverse
+    
+    _, first_index, group_index = np.unique(codes, return_index=True, return_inverse=True)
+    order = np.argsort(group_index, kind='stable')
+    bounds = np.searchsorted(group_index[order], np.arange(len(first_index) + 1))
+    
+    groups = []
+    for g, first in enumerate(first_index):
+        members = order[bounds[g]:bounds[g + 1]]
+        group = {dim: group_label(dim, dimensions[dim][first]) for dim in group_by}
+        group['complaints'] = int(members.size)
+        group['time_to_resolve'] = summarize_latency(to_resolve[members])
+        group['time_to_confirm'] = summarize_latency(to_confirm[members])
+        groups.append(group)
+    
+    return groups
+
+def get_resolution_analytics(group_by, days, hostel_id=None):
+    """
+    Serve resolution analytics from the cached snapshot. MAX(updated_at) is an
+    index lookup; only when it moves past the watermark are the changed rows
+    fetched and merged.
+    Returns None if the DB is unavailable.
+    """
+    conn = get_db_connection()
+    if not conn:
+        return None
+    
+    cursor = conn.cursor()
+    
+    try:
+        last_change = run_query_one(cursor, 'complaint_fingerprint')[0]
+        since = datetime.combine(datetime.now().date() - timedelta(days=days), datetime.min.time())
+        key = (group_by, since, hostel_id)
+        
+        with _analytics_lock:
+            watermark = _analytics_cache['watermark']
+            if last_change is not None and last_change != watermark:
+                # Overlap re-reads rows that committed late with an earlier updated_at
+                read_from = watermark - DELTA_SYNC_OVERLAP if watermark else datetime(1970, 1, 1)
+                merge_complaint_changes(*load_complaint_changes(cursor, read_from))
+                # A change this recent may still have slower writes committing before it;
+                # keep the watermark behind it so the next request re-checks the window
+                _analytics_cache['watermark'] = min(last_change, datetime.now() - DELTA_SYNC_OVERLAP)
+                _analytics_cache['results'] = {}
+            
+            snapshot = _analytics_cache['snapshot']
+            if snapshot is None:
+                snapshot = load_complaint_changes(cursor, datetime(1970, 1, 1))[1]
+            
+            results = _analytics_cache['results']
+            if key not in results:
+                if len(results) >= ANALYTICS_CACHE_SIZE:
+                    results.pop(next(iter(results)))
+                results[key] = {
+                    'since': since.isoformat(),
+                    'groups': compute_resolution_analytics(snapshot, group_by, since, hostel_id)
+                }
+            return results[key]
+    finally:
+        cursor.close()
+        conn.close()
+
+def get_analytics_hostel_scope():
+    """
+    Hostel an analytics request covers: the warden's own hostel unless the
+    `hostel` parameter names another hostel (or 'all') and the warden is
+    listed in CROSS_HOSTEL_WARDENS.
+    Returns (hostel_id, None), where None means all hostels, or (None, error response).
+    """
+    own_hostel = session['user']['hostel_id']
+    hostel_id = request.args.get('hostel', own_hostel)
+    if hostel_id == own_hostel:
+        return own_hostel, None
+    
+    # Authorize before the lookup so refused wardens cannot probe which hostel IDs exist
+    if session['user']['id'] not in CROSS_HOSTEL_WARDENS:
+        return None, (jsonify({'error': 'Not allowed to view other hostels'}), 403)
+    
+    if hostel_id != 'all':
+        conn = get_db_connection()
+        if not conn:
+            return None, (jsonify({'error': 'Database connection failed'}), 500)
+        
+        cursor = conn.cursor(dictionary=True)
+        
+        try:
+            if not run_query_one(cursor, 'hostel_by_id', (hostel_id,)):
+                return None, (jsonify({'error': 'Unknown hostel'}), 400)
+        finally:
+            cursor.close()
+            conn.close()
+    
+    return (None if hostel_id == 'all' else hostel_id), None
+
+@app.route('/api/warden/analytics/resolution', methods=['GET'])
+def get_warden_resolution_analytics():
+    """
+    Mean and percentile time-to-resolve and time-to-confirm per group.
+    Optional: group_by (comma separated: hostel, amenity, block, floor),
+    days (default 365), hostel (own hostel by default; another hostel ID or
+    'all' for wardens in CROSS_HOSTEL_WARDENS)
+    """
+    if 'user' not in session or session['user']['role'] != 'warden':
+        return jsonify({'error': 'Unauthorized'}), 401
+    
+    try:
+        requested = {
+            dim.strip() for dim in request.args.get('group_by', 'hostel').split(',') if dim.strip()
+        }
+        if not requested or not requested.issubset(ANALYTICS_DIMENSIONS):
+            return jsonify({'error': 'Invalid group_by dimension'}), 400
+        # Fixed order and no duplicates, so equivalent requests share a cache entry
+        group_by = tuple(dim for dim in ANALYTICS_DIMENSIONS if dim in requested)
+        
+        try:
+            days = int(request.args.get('days', 365))
+        except ValueError:
+            return jsonify({'error': 'Invalid days value'}), 400
+        if not 1 <= days <= 3650:
+            return jsonify({'error': 'Invalid days value'}), 400
+        
+        hostel_id, error = get_analytics_hostel_scope()
+        if error:
+            return error
+        
+        analytics = get_resolution_analytics(group_by, days, hostel_id)
+        if analytics is None:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        return jsonify({
+            'success': True,
+            'group_by': list(group_by),
+            'since': analytics['since'],
+            'histogram_buckets': list(LATENCY_BUCKET_LABELS),
+            'groups': analytics['groups']
+        }), 200
+        
+    except Exception as e:
+        print(f"Error retrieving resolution analytics: {str(e)}")
+        return jsonify({'error': 'Failed to retrieve analytics'}), 500
+
+@app.route('/api/warden/analytics/hotspots', methods=['GET'])
+def get_warden_hotspots():
+    """
+    Complaint counts per (hostel, block, floor) for heatmaps, served from ComplaintRollup.
+    Optional: days (default 30), hostel (own hostel by default; another hostel ID
+    or 'all' for wardens in CROSS_HOSTEL_WARDENS), amenity (Room, Washroom, Filter),
+    status (Pending, Resolved, Confirmed)
+    """
+    if 'user' not in session or session['user']['role'] != 'warden':
+        return jsonify({'error': 'Unauthorized'}), 401
+    
+    try:
+        try:
+            days = int(request.args.get('days', 30))
+        except ValueError:
+            return jsonify({'error': 'Invalid days value'}), 400
+        if not 1 <= days <= 3650:
+            return jsonify({'error': 'Invalid days value'}), 400
+        
+        hostel_id, error = get_analytics_hostel_scope()
+        if error:
+            return error
+        
+        amenity = request.args.get('amenity')
+        status = request.args.get('status')
+        since = datetime.now().date() - timedelta(days=days)
+        
+        conn = get_db_connection()
+        if not conn:
+            return jsonify({'error': 'Database connection failed'}), 500
+        
+        cursor = conn.cursor(dictionary=True)
+        
+        try:
+            if hostel_id is None:
+                rows = run_query(cursor, 'all_hotspots', (since,))
+            else:
+                rows = run_query(cursor, 'hostel_hotspots', (hostel_id, since))
+            
+            # Fold amenity/status breakdowns into one cell per location;
+            # amenity/status filters apply to the already-small rollup rows
+            cells = {}
+            for row in rows:
+                count = int(row['count'])
+                if count == 0:
+                    continue
+                if amenity and row['AmenityType'] != amenity:
+                    continue
+                if status and row['Status'] != status:
+                    continue
+                key = (row['HId'], row['Block'], row['Floor'])
+                cell = cells.setdefault(key, {
+                    'hostel': row['HId'],
+                    'block': row['Block'] or None,
+                    'floor': group_label('floor', row['Floor']),
+                    'total': 0,
+                    'by_amenity': {},
+                    'by_status': {}
+                })
+                cell['total'] += count
+                cell['by_amenity'][row['AmenityType']] = cell['by_amenity'].get(row['AmenityType'], 0) + count
+                cell['by_status'][row['Status']] = cell['by_status'].get(row['Status'], 0) + count
+            
+            return jsonify({
+                'success': True,
+                'since': since.isoformat(),
+                'cells': sorted(cells.values(), key=lambda c: c['total'], reverse=True)
+            }), 200
+            
+        finally:
+            cursor.close()
+            conn.close()
+            
+    except Exception as e:
+        print(f"Error retrieving hotspots: {str(e)}")
+        return jsonify({'error': 'Failed to retrieve hotspots'}), 500
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,292 @@
+"""
+Query-plan regression guard for the Hostel Maintenance System.
+
+Loads a large synthetic dataset into a scratch database, runs
+EXPLAIN FORMAT=JSON on every query registered in queries.py and fails
+when a table's access type, rows examined/produced or cost, or the
+query cost, get worse than the checked-in baseline (query_plan_baseline.json).
+
+Usage:
+    python check_query_plans.py                     # check against the baseline
+    python check_query_plans.py --update-baseline   # record a new baseline
+    python check_query_plans.py --skip-load         # reuse the loaded scratch database
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from create_homelike_db import create_tables
+from migrate_homelike_db import ROLLUP_BACKFILL
+from queries import QUERIES, explain_query
+
+load_dotenv()
+
+# Scratch database - dropped and recreated on every load, never point at production data
+DB_CONFIG = {
+    'user': os.getenv('DB_USER', 'root'),
+    'password': os.getenv('DB_PASSWORD', ''),
+    'host': os.getenv('DB_HOST', 'localhost')
+}
+PLAN_CHECK_DB = os.getenv('PLAN_CHECK_DB', 'homelike_plan_check')
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'query_plan_baseline.json')
+
+# MySQL access types from best to worst
+ACCESS_TYPES = [
+    'system', 'const', 'eq_ref', 'ref', 'fulltext', 'ref_or_null', 'index_merge',
+    'unique_subquery', 'index_subquery', 'range', 'index', 'ALL'
+]
+
+# Synthetic dataset shape
+HOSTELS = 20
+BLOCKS_PER_HOSTEL = 4
+FLOORS_PER_BLOCK = 5
+ROOMS_PER_FLOOR = 10
+STUDENTS_PER_HOSTEL = 400
+BATCH_SIZE = 5000
+
+NOW = datetime.now().replace(microsecond=0)
+
+# Parameters each registered query is explained with (ids exist in the synthetic data)
+SAMPLE_PARAMS = {
+    'warden_by_email': ('warden1@plancheck.edu',),
+    'student_by_email': ('student1@plancheck.edu',),
+    'hostel_by_id': ('H1',),
+    'hostel_warden': ('H1',),
+    'complaint_count': (),
+    'insert_complaint': ('CPLAN', 'Plan check', NOW, NOW, 'S1', 'WAR1', 'H1', 'R1_1_1_1', None, None),
+    'student_resolved_complaint': ('C1', 'S1'),
+    'confirm_complaint': (NOW, NOW, 'C1'),
+    'warden_complaint': ('C1', 'WAR1', 'H1'),
+    'resolve_complaint': (NOW, NOW, 'C1', 'Pending'),
+    'student_complaints': ('S1',),
+    'student_complaints_delta': ('S1', NOW - timedelta(days=1)),
+    'warden_complaints': ('WAR1', 'H1'),
+    'warden_complaint_count': ('WAR1', 'H1'),
+    'warden_complaint_count_by_status': ('WAR1', 'H1', 'Pending'),
+    'room_location': ('R1_1_1_1',),
+    'washroom_location': ('W1_1_1',),
+    'filter_location': ('F1_1_1',),
+    'upsert_complaint_rollup': ('H1', NOW.date(), 'H1-A', 1, 'Room', 'Pending', 1),
+    'hostel_hotspots': ('H1', NOW.date() - timedelta(days=30)),
+    'all_hotspots': (NOW.date() - timedelta(days=30),),
+    'complaint_fingerprint': (),
+    'complaint_snapshot': (NOW - timedelta(hours=1),)
+}
+
+def insert_rows(cursor, query, rows):
+    """Insert rows in batches with executemany."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(query, rows[start:start + BATCH_SIZE])
+
+def load_synthetic_data(conn, complaints):
+    """Recreate the scratch database and fill it with a deterministic synthetic dataset."""
+    rng = random.Random(42)
+    cursor = conn.cursor()
+
+    print(f"Recreating scratch database '{PLAN_CHECK_DB}'...")
+    cursor.execute(f"DROP DATABASE IF EXISTS {PLAN_CHECK_DB}")
+    cursor.execute(f"CREATE DATABASE {PLAN_CHECK_DB} DEFAULT CHARACTER SET 'utf8'")
+    cursor.execute(f"USE {PLAN_CHECK_DB}")
+    create_tables(cursor)
+
+    hostels, rooms, washrooms, filters, wardens, students = [], [], [], [], [], []
+    amenities = {}
+    for h in range(1, HOSTELS + 1):
+        hid = f"H{h}"
+        hostels.append((hid, f"Hostel {h}", f"Hostel {h} Main Building"))
+        wardens.append((f"WAR{h}", f"Warden {h}", f"warden{h}@plancheck.edu", '+91-9000000000', hid))
+        hostel_amenities = []
+        for b in range(1, BLOCKS_PER_HOSTEL + 1):
+            block = f"{hid}-{chr(64 + b)}"
+            for floor in range(1, FLOORS_PER_BLOCK + 1):
+                for r in range(1, ROOMS_PER_FLOOR + 1):
+                    rno = f"R{h}_{b}_{floor}_{r}"
+                    rooms.append((rno, 2, block, floor))
+                    hostel_amenities.append(('Room', rno))
+                washroom_id = f"W{h}_{b}_{floor}"
+                washrooms.append((washroom_id, floor, block))
+                hostel_amenities.append(('Washroom', washroom_id))
+                filter_id = f"F{h}_{b}_{floor}"
+                filters.append((filter_id, floor, block))
+                hostel_amenities.append(('Filter', filter_id))
+        amenities[hid] = hostel_amenities
+
+    for s in range(1, HOSTELS * STUDENTS_PER_HOSTEL + 1):
+        hid = f"H{(s - 1) % HOSTELS + 1}"
+        rno = rng.choice([a for t, a in amenities[hid] if t == 'Room'])
+        students.append((f"S{s}", f"Student {s}", f"student{s}@plancheck.edu", '+91-9100000000', hid, rno))
+
+    print(f"Loading {len(rooms)} rooms, {len(students)} students and {complaints} complaints...")
+    insert_rows(cursor, "INSERT INTO Hostel (HId, HName, WName) VALUES (%s, %s, %s)", hostels)
+    insert_rows(cursor, "INSERT INTO Rooms (RNo, Occupancy, Block, Floor) VALUES (%s, %s, %s, %s)", rooms)
+    insert_rows(cursor, "INSERT INTO Washroom (WashroomID, Floor, Block) VALUES (%s, %s, %s)", washrooms)
+    insert_rows(cursor, "INSERT INTO Filter (FId, Floor, Block) VALUES (%s, %s, %s)", filters)
+    insert_rows(cursor, "INSERT INTO Warden (WardenID, WName, Wmail, Wcontact, HId) VALUES (%s, %s, %s, %s, %s)", wardens)
+    insert_rows(
+        cursor,
+        "INSERT INTO Student (SId, SName, Smail, Scontact, HId, RNo) VALUES (%s, %s, %s, %s, %s, %s)",
+        students
+    )
+
+    rows = []
+    for c in range(1, complaints + 1):
+        sid, _, _, _, hid, _ = students[rng.randrange(len(students))]
+        amenity_type, amenity_id = rng.choice(amenities[hid])
+        filed_at = NOW - timedelta(seconds=rng.randrange(365 * 86400))
+        status = rng.choice(['Pending', 'Resolved', 'Confirmed'])
+        resolved_at = filed_at + timedelta(hours=rng.expovariate(1 / 30)) if status != 'Pending' else None
+        confirmed_at = resolved_at + timedelta(hours=rng.expovariate(1 / 20)) if status == 'Confirmed' else None
+        rows.append((
+            f"C{c}", 'Synthetic complaint', status, filed_at, resolved_at, confirmed_at,
+            confirmed_at or resolved_at or filed_at,
+            sid, f"WAR{hid[1:]}", hid,
+            amenity_id if amenity_type == 'Room' else None,
+            amenity_id if amenity_type == 'Washroom' else None,
+            amenity_id if amenity_type == 'Filter' else None
+        ))
+    insert_rows(
+        cursor,
+        "INSERT INTO Complaint "
+        "(CId, description, Status, date_time, resolved_at, confirmed_at, updated_at, "
+        "SId, WardenID, HId, RNo, WashroomID, FId) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        rows
+    )
+    cursor.execute(ROLLUP_BACKFILL)
+    conn.commit()
+
+    cursor.execute("ANALYZE TABLE Hostel, Rooms, Washroom, Filter, Warden, Student, Complaint, ComplaintRollup")
+    cursor.fetchall()
+    cursor.close()
+
+# Per-table plan metrics compared against the baseline
+PLAN_METRICS = ('rows_examined', 'rows_produced', 'read_cost', 'prefix_cost')
+
+def summarize_plan(plan):
+    """
+    Flatten an EXPLAIN JSON plan into the query cost plus, per table, the
+    access type and metrics. rows_examined is per scan; rows_produced
+    (rows_produced_per_join) and the costs also grow when a join order change
+    makes an inner table be scanned more often.
+    """
+    tables = {}
+
+    def walk(node):
+        if isinstance(node, dict):
+            if 'table_name' in node and 'access_type' in node:
+                cost_info = node.get('cost_info', {})
+                tables[node['table_name']] = {
+                    'access_type': node['access_type'],
+                    'rows_examined': int(node.get('rows_examined_per_scan', 0)),
+                    'rows_produced': int(node.get('rows_produced_per_join', 0)),
+                    'read_cost': float(cost_info.get('read_cost', 0)),
+                    'prefix_cost': float(cost_info.get('prefix_cost', 0))
+                }
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(plan)
+    query_cost = float(plan.get('query_block', {}).get('cost_info', {}).get('query_cost', 0))
+    return {'query_cost': query_cost, 'tables': tables}
+
+def access_rank(access_type):
+    """Position of an access type in ACCESS_TYPES; unknown types rank as worst."""
+    return ACCESS_TYPES.index(access_type) if access_type in ACCESS_TYPES else len(ACCESS_TYPES)
+
+def grew(before, now, tolerance):
+    """True when a metric grew beyond the tolerance (small absolute changes are noise)."""
+    return now > max(before * tolerance, before + 10)
+
+def compare_plan(baseline, current, tolerance):
+    """
+    Return a list of regressions of `current` against `baseline` for one query.
+    Only the query cost and metrics recorded in the baseline are compared, so a
+    baseline may pin just the worst acceptable access type of each table.
+    """
+    problems = []
+    if 'query_cost' in baseline and grew(baseline['query_cost'], current['query_cost'], tolerance):
+        problems.append(f"query cost {baseline['query_cost']} -> {current['query_cost']}")
+
+    for table, now in current['tables'].items():
+        before = baseline['tables'].get(table)
+        if before is None:
+            problems.append(f"{table}: not in baseline plan ({now['access_type']}, {now['rows_examined']} rows)")
+            continue
+        if access_rank(now['access_type']) > access_rank(before['access_type']):
+            problems.append(f"{table}: access type {before['access_type']} -> {now['access_type']}")
+        for metric in PLAN_METRICS:
+            if metric in before and grew(before[metric], now[metric], tolerance):
+                problems.append(f"{table}: {metric} {before[metric]} -> {now[metric]}")
+    return problems
+
+def main():
+    """Load data, explain every registered query and check or update the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--complaints', type=int, default=200000, help='synthetic complaints to load')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='allowed growth factor of rows and costs')
+    parser.add_argument('--skip-load', action='store_true', help='reuse the existing scratch database')
+    parser.add_argument('--update-baseline', action='store_true', help='write current plans as the baseline')
+    args = parser.parse_args()
+
+    missing = sorted(set(QUERIES) - set(SAMPLE_PARAMS))
+    if missing:
+        print(f"No sample parameters for: {', '.join(missing)}")
+        return 1
+
+    conn = mysql.connector.connect(**DB_CONFIG)
+    try:
+        if not args.skip_load:
+            load_synthetic_data(conn, args.complaints)
+        conn.database = PLAN_CHECK_DB
+
+        cursor = conn.cursor(dictionary=True)
+        plans = {name: summarize_plan(explain_query(cursor, name, SAMPLE_PARAMS[name])) for name in sorted(QUERIES)}
+        cursor.close()
+        # EXPLAIN never executes writes, but keep the scratch data pristine regardless
+        conn.rollback()
+    finally:
+        conn.close()
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(plans, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {BASELINE_PATH} ({len(plans)} queries)")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print(f"No baseline at {BASELINE_PATH}. Run with --update-baseline first.")
+        return 1
+
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    failed = False
+    for name, summary in plans.items():
+        if name not in baseline:
+            print(f"❌ {name}: no baseline entry (run with --update-baseline)")
+            failed = True
+            continue
+        problems = compare_plan(baseline[name], summary, args.tolerance)
+        if problems:
+            failed = True
+            print(f"❌ {name}")
+            for problem in problems:
+                print(f"     {problem}")
+        else:
+            print(f"✅ {name}")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -97,6 +97,9 @@ def create_tables(cursor):
         "  `description` TEXT NOT NULL,"
         "  `Status` VARCHAR(30) DEFAULT 'Pending',"
         "  `date_time` DATETIME NOT NULL,"
+        "  `resolved_at` DATETIME NULL,"
+        "  `confirmed_at` DATETIME NULL,"
+        "  `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),"
         "  `SId` VARCHAR(20) NOT NULL,"
         "  `WardenID` VARCHAR(20) NOT NULL,"
         "  `HId` VARCHAR(20) NOT NULL,"
@@ -104,6 +107,8 @@ def create_tables(cursor):
         "  `WashroomID` VARCHAR(20) NULL,"
         "  `FId` VARCHAR(20) NULL,"
         "  PRIMARY KEY (`CId`),"
+        "  KEY `idx_complaint_student_updated` (`SId`, `updated_at`),"
+        "  KEY `idx_complaint_updated` (`updated_at`),"
         "  FOREIGN KEY (`SId`) REFERENCES `Student` (`SId`),"
         "  FOREIGN KEY (`WardenID`) REFERENCES `Warden` (`WardenID`),"
         "  FOREIGN KEY (`HId`) REFERENCES `Hostel` (`HId`),"
@@ -113,6 +118,23 @@ def create_tables(cursor):
         "  CHECK (`RNo` IS NOT NULL OR `WashroomID` IS NOT NULL OR `FId` IS NOT NULL)"
         ") ENGINE=InnoDB")
 
+    # Complaint counts by location/amenity/status/filing day, kept up to date
+    # by the write routes so hotspot queries never touch Complaint
+    TABLES['ComplaintRollup'] = (
+        "CREATE TABLE `ComplaintRollup` ("
+        "  `HId` VARCHAR(20) NOT NULL,"
+        "  `Day` DATE NOT NULL,"
+        "  `Block` VARCHAR(20) NOT NULL DEFAULT '',"
+        "  `Floor` INT NOT NULL DEFAULT -1,"  # -1 = floor not recorded
+        "  `AmenityType` VARCHAR(20) NOT NULL,"
+        "  `Status` VARCHAR(30) NOT NULL,"
+        "  `Count` INT NOT NULL DEFAULT 0,"
+        "  PRIMARY KEY (`HId`, `Day`, `Block`, `Floor`, `AmenityType`, `Status`),"
+        "  KEY `idx_rollup_day` (`Day`),"
+        "  FOREIGN KEY (`HId`) REFERENCES `Hostel` (`HId`)"
+        "    ON DELETE CASCADE"
+        ") ENGINE=InnoDB")
+
     # --- Execution ---
     for table_name in TABLES:
         table_description = TABLES[table_name]
@@ -141,7 +163,7 @@ def main():
         # Drop tables in reverse order of creation to avoid FK issues
         print("Dropping existing tables (if any)...")
         cursor.execute("SET FOREIGN_KEY_CHECKS=0;")
-        cursor.execute("DROP TABLE IF EXISTS Complaint, Student, Warden, Filter, Washroom, Rooms, Hostel;")
+        cursor.execute("DROP TABLE IF EXISTS ComplaintRollup, Complaint, Student, Warden, Filter, Washroom, Rooms, Hostel;")
         cursor.execute("SET FOREIGN_KEY_CHECKS=1;")
         print("Tables dropped.")
 
@@ -0,0 +1,139 @@
+import mysql.connector
+from mysql.connector import errorcode
+
+from create_homelike_db import DB_CONFIG, DB_NAME
+
+# Errors meaning a step was already applied to this database
+ALREADY_APPLIED = (
+    errorcode.ER_DUP_FIELDNAME,
+    errorcode.ER_DUP_KEYNAME,
+    errorcode.ER_TABLE_EXISTS_ERROR
+)
+
+# Rebuilds hotspot counts from Complaint (also used by check_query_plans.py)
+ROLLUP_BACKFILL = """
+INSERT INTO ComplaintRollup (HId, Day, Block, Floor, AmenityType, Status, Count)
+SELECT
+    c.HId,
+    DATE(c.date_time),
+    COALESCE(r.Block, w.Block, f.Block, ''),
+    COALESCE(r.Floor, w.Floor, f.Floor, -1),
+    CASE
+        WHEN c.RNo IS NOT NULL THEN 'Room'
+        WHEN c.WashroomID IS NOT NULL THEN 'Washroom'
+        ELSE 'Filter'
+    END,
+    c.Status,
+    COUNT(*)
+FROM Complaint c
+LEFT JOIN Rooms r ON c.RNo = r.RNo
+LEFT JOIN Washroom w ON c.WashroomID = w.WashroomID
+LEFT JOIN Filter f ON c.FId = f.FId
+GROUP BY 1, 2, 3, 4, 5, 6
+"""
+
+def get_migrations():
+    """
+    Upgrade steps for databases created before the latest schema, in order.
+    Each step is (description, DDL, backfill statements). Backfills only run
+    when the DDL was applied in this run, so the script is safe to re-run.
+    """
+
+    MIGRATIONS = []
+
+    # Resolution analytics: first resolution / confirmation time.
+    # Existing complaints keep NULL (their history is unknown) and are
+    # skipped by the latency statistics.
+    MIGRATIONS.append((
+        "Complaint.resolved_at, Complaint.confirmed_at",
+        "ALTER TABLE `Complaint`"
+        "  ADD COLUMN `resolved_at` DATETIME NULL AFTER `date_time`,"
+        "  ADD COLUMN `confirmed_at` DATETIME NULL AFTER `resolved_at`",
+        []
+    ))
+
+    # Hotspot rollup, filled from the existing complaints
+    MIGRATIONS.append((
+        "ComplaintRollup",
+        "CREATE TABLE `ComplaintRollup` ("
+        "  `HId` VARCHAR(20) NOT NULL,"
+        "  `Day` DATE NOT NULL,"
+        "  `Block` VARCHAR(20) NOT NULL DEFAULT '',"
+        "  `Floor` INT NOT NULL DEFAULT -1,"
+        "  `AmenityType` VARCHAR(20) NOT NULL,"
+        "  `Status` VARCHAR(30) NOT NULL,"
+        "  `Count` INT NOT NULL DEFAULT 0,"
+        "  PRIMARY KEY (`HId`, `Day`, `Block`, `Floor`, `AmenityType`, `Status`),"
+        "  KEY `idx_rollup_day` (`Day`),"
+        "  FOREIGN KEY (`HId`) REFERENCES `Hostel` (`HId`)"
+        "    ON DELETE CASCADE"
+        ") ENGINE=InnoDB",
+        [ROLLUP_BACKFILL]
+    ))
+
+    # Delta sync: last change time, defaulted to the latest known lifecycle time
+    MIGRATIONS.append((
+        "Complaint.updated_at",
+        "ALTER TABLE `Complaint`"
+        "  ADD COLUMN `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) AFTER `confirmed_at`",
+        ["UPDATE Complaint SET updated_at = COALESCE(confirmed_at, resolved_at, date_time)"]
+    ))
+
+    MIGRATIONS.append((
+        "Complaint index (SId, updated_at)",
+        "ALTER TABLE `Complaint` ADD KEY `idx_complaint_student_updated` (`SId`, `updated_at`)",
+        []
+    ))
+
+    # Also serves the analytics change check and incremental snapshot
+    MIGRATIONS.append((
+        "Complaint index (updated_at)",
+        "ALTER TABLE `Complaint` ADD KEY `idx_complaint_updated` (`updated_at`)",
+        []
+    ))
+
+    return MIGRATIONS
+
+def apply_migrations(cnx, cursor):
+    """Run every migration step that is not applied yet, committing after each."""
+    for description, ddl, backfills in get_migrations():
+        print(f"Migrating {description}... ", end='')
+        try:
+            cursor.execute(ddl)
+        except mysql.connector.Error as err:
+            if err.errno in ALREADY_APPLIED:
+                print("already applied.")
+                continue
+            raise
+
+        for statement in backfills:
+            cursor.execute(statement)
+        cnx.commit()
+        print("OK")
+
+def main():
+    """Connect to the existing database and upgrade its schema in place."""
+    cnx = None
+    cursor = None
+    try:
+        cnx = mysql.connector.connect(database=DB_NAME, **DB_CONFIG)
+        cursor = cnx.cursor()
+
+        apply_migrations(cnx, cursor)
+        print(f"\nDatabase '{DB_NAME}' is up to date!")
+
+    except mysql.connector.Error as err:
+        if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+            print("Something is wrong with your user name or password")
+        elif err.errno == errorcode.ER_BAD_DB_ERROR:
+            print(f"Database '{DB_NAME}' does not exist. Run create_homelike_db.py instead.")
+        else:
+            print(err)
+    finally:
+        if cursor:
+            cursor.close()
+        if cnx:
+            cnx.close()
+
+if __name__ == "__main__":
+    main()
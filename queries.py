@@ -0,0 +1,180 @@
+"""
+Named SQL query registry for the Hostel Maintenance System.
+Every statement app.py runs lives here so check_query_plans.py can EXPLAIN them all.
+"""
+
+import json
+import os
+import time
+import mysql.connector
+
+QUERIES = {}
+
+# ---------------- Users ----------------
+QUERIES['warden_by_email'] = "SELECT * FROM Warden WHERE Wmail = %s"
+
+QUERIES['student_by_email'] = "SELECT * FROM Student WHERE Smail = %s"
+
+QUERIES['hostel_by_id'] = "SELECT HId FROM Hostel WHERE HId = %s"
+
+QUERIES['hostel_warden'] = "SELECT w.WardenID FROM Warden w WHERE w.HId = %s LIMIT 1"
+
+# ---------------- Complaint writes ----------------
+QUERIES['complaint_count'] = "SELECT COUNT(*) as cnt FROM Complaint"
+
+QUERIES['insert_complaint'] = """
+INSERT INTO Complaint
+(CId, description, Status, date_time, updated_at, SId, WardenID, HId, RNo, WashroomID, FId)
+VALUES (%s, %s, 'Pending', %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+QUERIES['student_resolved_complaint'] = (
+    "SELECT * FROM Complaint WHERE CId = %s AND SId = %s AND Status = 'Resolved'"
+)
+
+# COALESCE keeps the first confirmation/resolution time so latency analytics stay stable.
+# The Status guard makes each transition apply once (rowcount 1) under concurrent requests.
+QUERIES['confirm_complaint'] = (
+    "UPDATE Complaint SET Status = 'Confirmed', confirmed_at = COALESCE(confirmed_at, %s), "
+    "updated_at = %s WHERE CId = %s AND Status = 'Resolved'"
+)
+
+QUERIES['warden_complaint'] = (
+    "SELECT * FROM Complaint WHERE CId = %s AND WardenID = %s AND HId = %s"
+)
+
+QUERIES['resolve_complaint'] = (
+    "UPDATE Complaint SET Status = 'Resolved', resolved_at = COALESCE(resolved_at, %s), "
+    "updated_at = %s WHERE CId = %s AND Status = %s"
+)
+
+# ---------------- Complaint listings & stats ----------------
+QUERIES['student_complaints'] = """
+SELECT
+    CId, description, Status, date_time,
+    RNo, WashroomID, FId
+FROM Complaint
+WHERE SId = %s
+ORDER BY date_time DESC
+"""
+
+# Range scan on idx_complaint_student_updated (SId, updated_at)
+QUERIES['student_complaints_delta'] = """
+SELECT
+    CId, description, Status, date_time, updated_at,
+    RNo, WashroomID, FId
+FROM Complaint
+WHERE SId = %s AND updated_at > %s
+ORDER BY updated_at
+"""
+
+QUERIES['warden_complaints'] = """
+SELECT
+    c.CId, c.description, c.Status, c.date_time,
+    c.SId, s.SName, s.Smail,
+    c.RNo, c.WashroomID, c.FId,
+    c.HId
+FROM Complaint c
+JOIN Student s ON c.SId = s.SId
+WHERE c.WardenID = %s AND c.HId = %s
+ORDER BY c.date_time DESC
+"""
+
+QUERIES['warden_complaint_count'] = (
+    "SELECT COUNT(*) as count FROM Complaint WHERE WardenID = %s AND HId = %s"
+)
+
+QUERIES['warden_complaint_count_by_status'] = (
+    "SELECT COUNT(*) as count FROM Complaint WHERE WardenID = %s AND HId = %s AND Status = %s"
+)
+
+# ---------------- Hotspot rollup ----------------
+QUERIES['room_location'] = "SELECT Block, Floor FROM Rooms WHERE RNo = %s"
+
+QUERIES['washroom_location'] = "SELECT Block, Floor FROM Washroom WHERE WashroomID = %s"
+
+QUERIES['filter_location'] = "SELECT Block, Floor FROM Filter WHERE FId = %s"
+
+QUERIES['upsert_complaint_rollup'] = """
+INSERT INTO ComplaintRollup (HId, Day, Block, Floor, AmenityType, Status, Count)
+VALUES (%s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE Count = Count + VALUES(Count)
+"""
+
+QUERIES['hostel_hotspots'] = """
+SELECT HId, Block, Floor, AmenityType, Status, SUM(Count) AS count
+FROM ComplaintRollup
+WHERE HId = %s AND Day >= %s
+GROUP BY HId, Block, Floor, AmenityType, Status
+"""
+
+QUERIES['all_hotspots'] = """
+SELECT HId, Block, Floor, AmenityType, Status, SUM(Count) AS count
+FROM ComplaintRollup
+WHERE Day >= %s
+GROUP BY HId, Block, Floor, AmenityType, Status
+"""
+
+# ---------------- Resolution analytics ----------------
+# MAX over idx_complaint_updated is a single index lookup ("Select tables optimized away")
+QUERIES['complaint_fingerprint'] = "SELECT MAX(updated_at) AS last_change FROM Complaint"
+
+# Complaints changed after a watermark; a range scan on idx_complaint_updated
+QUERIES['complaint_snapshot'] = """
+SELECT
+    c.CId,
+    c.HId,
+    CASE
+        WHEN c.RNo IS NOT NULL THEN 'Room'
+        WHEN c.WashroomID IS NOT NULL THEN 'Washroom'
+        ELSE 'Filter'
+    END AS amenity,
+    COALESCE(r.Block, w.Block, f.Block, '') AS Block,
+    COALESCE(r.Floor, w.Floor, f.Floor, -1) AS Floor,  -- -1 = UNKNOWN_FLOOR
+    c.date_time,
+    c.resolved_at,
+    c.confirmed_at
+FROM Complaint c
+LEFT JOIN Rooms r ON c.RNo = r.RNo
+LEFT JOIN Washroom w ON c.WashroomID = w.WashroomID
+LEFT JOIN Filter f ON c.FId = f.FId
+WHERE c.updated_at > %s
+"""
+
+
+def run_query(cursor, name, params=()):
+    """
+    Execute a registered query and return all rows (None for writes).
+    Logs the query plan when SLOW_QUERY_MS is set and exceeded.
+    """
+    started = time.perf_counter()
+    cursor.execute(QUERIES[name], params)
+    rows = cursor.fetchall() if cursor.with_rows else None
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    # Read per call so a value loaded from .env after import still applies (milliseconds, 0 = off)
+    slow_query_ms = float(os.getenv('SLOW_QUERY_MS', '0'))
+    if slow_query_ms and elapsed_ms > slow_query_ms:
+        log_query_plan(cursor, name, params, elapsed_ms)
+
+    return rows
+
+def run_query_one(cursor, name, params=()):
+    """Execute a registered query and return its first row, or None."""
+    rows = run_query(cursor, name, params)
+    return rows[0] if rows else None
+
+def explain_query(cursor, name, params=()):
+    """Return the parsed EXPLAIN FORMAT=JSON plan of a registered query."""
+    cursor.execute("EXPLAIN FORMAT=JSON " + QUERIES[name], params)
+    row = cursor.fetchone()
+    plan = list(row.values())[0] if isinstance(row, dict) else row[0]
+    return json.loads(plan)
+
+def log_query_plan(cursor, name, params, elapsed_ms):
+    """Print the plan of a slow query; never fails the caller's request."""
+    try:
+        plan = explain_query(cursor, name, params)
+        print(f"🐢 Slow query '{name}' took {elapsed_ms:.1f} ms. Plan: {json.dumps(plan)}")
+    except mysql.connector.Error as err:
+        print(f"Could not explain slow query '{name}': {err}")
@@ -4,6 +4,7 @@
 
 -- Clear existing data (use with caution in production)
 SET FOREIGN_KEY_CHECKS=0;
+TRUNCATE TABLE ComplaintRollup;
 TRUNCATE TABLE Complaint;
 TRUNCATE TABLE Student;
 TRUNCATE TABLE Warden;
@@ -70,21 +71,45 @@ INSERT INTO Student (SId, SName, Smail, Scontact, HId, RNo) VALUES
 ('STU7', 'Frank Miller', 'student7@university.edu', '+91-9123456795', 'H3', 'R106');
 
 -- ==================== COMPLAINTS ====================
-INSERT INTO Complaint (CId, description, Status, date_time, SId, WardenID, HId, RNo, WashroomID, FId) VALUES 
+INSERT INTO Complaint (CId, description, Status, date_time, resolved_at, confirmed_at, SId, WardenID, HId, RNo, WashroomID, FId) VALUES 
 
 -- PENDING COMPLAINTS
-('C001', 'Water leakage from ceiling in room', 'Pending', NOW(), 'STU1', 'WAR1', 'H1', 'R101', NULL, NULL),
-('C002', 'Broken tap in washroom, water flowing continuously', 'Pending', NOW(), 'STU2', 'WAR1', 'H1', NULL, 'W1', NULL),
-('C003', 'Water filter not working properly, low water pressure', 'Pending', DATE_SUB(NOW(), INTERVAL 2 DAY), 'STU3', 'WAR1', 'H1', NULL, NULL, 'F1'),
+('C001', 'Water leakage from ceiling in room', 'Pending', NOW(), NULL, NULL, 'STU1', 'WAR1', 'H1', 'R101', NULL, NULL),
+('C002', 'Broken tap in washroom, water flowing continuously', 'Pending', NOW(), NULL, NULL, 'STU2', 'WAR1', 'H1', NULL, 'W1', NULL),
+('C003', 'Water filter not working properly, low water pressure', 'Pending', DATE_SUB(NOW(), INTERVAL 2 DAY), NULL, NULL, 'STU3', 'WAR1', 'H1', NULL, NULL, 'F1'),
 
 -- RESOLVED COMPLAINTS (awaiting student confirmation)
-('C004', 'Broken window pane in room', 'Resolved', DATE_SUB(NOW(), INTERVAL 3 DAY), 'STU4', 'WAR1', 'H1', 'R201', NULL, NULL),
-('C005', 'Damaged floor tiles in washroom', 'Resolved', DATE_SUB(NOW(), INTERVAL 1 DAY), 'STU5', 'WAR2', 'H2', NULL, 'W4', NULL),
+('C004', 'Broken window pane in room', 'Resolved', DATE_SUB(NOW(), INTERVAL 3 DAY), DATE_SUB(NOW(), INTERVAL 1 DAY), NULL, 'STU4', 'WAR1', 'H1', 'R201', NULL, NULL),
+('C005', 'Damaged floor tiles in washroom', 'Resolved', DATE_SUB(NOW(), INTERVAL 1 DAY), DATE_SUB(NOW(), INTERVAL 6 HOUR), NULL, 'STU5', 'WAR2', 'H2', NULL, 'W4', NULL),
 
 -- CONFIRMED COMPLAINTS (resolved and confirmed by student)
-('C006', 'Faulty light bulb in washroom', 'Confirmed', DATE_SUB(NOW(), INTERVAL 5 DAY), 'STU6', 'WAR2', 'H2', NULL, 'W5', NULL),
-('C007', 'Clogged drain in room', 'Confirmed', DATE_SUB(NOW(), INTERVAL 7 DAY), 'STU1', 'WAR1', 'H1', 'R102', NULL, NULL),
-('C008', 'Water filter replaced successfully', 'Confirmed', DATE_SUB(NOW(), INTERVAL 4 DAY), 'STU3', 'WAR1', 'H1', NULL, NULL, 'F2');
+('C006', 'Faulty light bulb in washroom', 'Confirmed', DATE_SUB(NOW(), INTERVAL 5 DAY), DATE_SUB(NOW(), INTERVAL 4 DAY), DATE_SUB(NOW(), INTERVAL 3 DAY), 'STU6', 'WAR2', 'H2', NULL, 'W5', NULL),
+('C007', 'Clogged drain in room', 'Confirmed', DATE_SUB(NOW(), INTERVAL 7 DAY), DATE_SUB(NOW(), INTERVAL 5 DAY), DATE_SUB(NOW(), INTERVAL 4 DAY), 'STU1', 'WAR1', 'H1', 'R102', NULL, NULL),
+('C008', 'Water filter replaced successfully', 'Confirmed', DATE_SUB(NOW(), INTERVAL 4 DAY), DATE_SUB(NOW(), INTERVAL 3 DAY), DATE_SUB(NOW(), INTERVAL 2 DAY), 'STU3', 'WAR1', 'H1', NULL, NULL, 'F2');
+
+-- Last change time used by the student delta-sync endpoint
+UPDATE Complaint SET updated_at = COALESCE(confirmed_at, resolved_at, date_time);
+
+-- ==================== HOTSPOT ROLLUP ====================
+-- Backfill ComplaintRollup from Complaint (the app keeps it current afterwards)
+INSERT INTO ComplaintRollup (HId, Day, Block, Floor, AmenityType, Status, Count)
+SELECT
+    c.HId,
+    DATE(c.date_time),
+    COALESCE(r.Block, w.Block, f.Block, ''),
+    COALESCE(r.Floor, w.Floor, f.Floor, -1),
+    CASE
+        WHEN c.RNo IS NOT NULL THEN 'Room'
+        WHEN c.WashroomID IS NOT NULL THEN 'Washroom'
+        ELSE 'Filter'
+    END,
+    c.Status,
+    COUNT(*)
+FROM Complaint c
+LEFT JOIN Rooms r ON c.RNo = r.RNo
+LEFT JOIN Washroom w ON c.WashroomID = w.WashroomID
+LEFT JOIN Filter f ON c.FId = f.FId
+GROUP BY 1, 2, 3, 4, 5, 6;
 
 -- ==================== STATISTICS ====================
 -- Total Complaints: 8